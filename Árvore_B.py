@@ -1,13 +1,164 @@
 import gradio as gr
+import ast
+import bisect
+import multiprocessing
+import os
+import random
+import re
 import sys
+import time
 import tempfile
 import networkx as nx
 import matplotlib.pyplot as plt
 
+# ===================================================================
+# CODIFICAÇÃO DE CHAVES (BYTES COM ORDEM PRESERVADA)
+# ===================================================================
+
+_TAG_INT_NEG, _TAG_INT_POS, _TAG_STR, _TAG_BYTES, _TAG_TUPLA = 1, 2, 3, 4, 5
+_INVERTER = bytes(range(255, -1, -1))
+
+class ChaveCodificada(bytes):
+    """Chave já codificada: compara como bytes, mas é exibida com o valor original."""
+    __slots__ = ()
+
+    def __str__(self):
+        return str(decodificar_chave(self))
+
+def codificar_chave(k):
+    """Codifica int, str, bytes ou tuplas desses tipos em bytes cuja ordem lexicográfica
+    é a ordem natural das chaves. Chaves já codificadas são devolvidas sem alteração."""
+    if isinstance(k, ChaveCodificada): return k
+    partes = []
+    _codificar(k, partes)
+    return ChaveCodificada(b"".join(partes))
+
+def _codificar(k, partes):
+    if isinstance(k, int):
+        # Tamanho da magnitude antes dos dígitos: inteiros com mais bytes são maiores.
+        # Negativos têm tamanho e dígitos invertidos para que a ordem também se inverta.
+        magnitude = abs(k).to_bytes((abs(k).bit_length() + 7) // 8, "big")
+        if len(magnitude) > 255: raise ValueError("Chave inteira grande demais para ser codificada.")
+        if k >= 0: partes += (bytes((_TAG_INT_POS, len(magnitude))), magnitude)
+        else: partes += (bytes((_TAG_INT_NEG, 255 - len(magnitude))), magnitude.translate(_INVERTER))
+    elif isinstance(k, (str, bytes)):
+        # O byte 0x00 é escapado como 0x00 0xFF e o valor termina em 0x00 0x00,
+        # de modo que um prefixo sempre ordena antes das suas extensões.
+        dados = k.encode("utf-8") if isinstance(k, str) else k
+        tag = _TAG_STR if isinstance(k, str) else _TAG_BYTES
+        partes += (bytes((tag,)), dados.replace(b"\x00", b"\x00\xff"), b"\x00\x00")
+    elif isinstance(k, tuple):
+        partes.append(bytes((_TAG_TUPLA,)))
+        for item in k: _codificar(item, partes)
+        partes.append(b"\x00")
+    else:
+        raise TypeError(f"Tipo de chave não suportado: {type(k).__name__}.")
+
+def _codificar_ou_nada(k):
+    try: return codificar_chave(k)
+    except (ValueError, TypeError): return None
+
+def decodificar_chave(dados):
+    """Inverso de codificar_chave."""
+    return _decodificar(dados, 0)[0]
+
+def _decodificar(dados, pos):
+    tag = dados[pos]; pos += 1
+    if tag == _TAG_INT_POS:
+        n = dados[pos]
+        return int.from_bytes(dados[pos+1:pos+1+n], "big"), pos + 1 + n
+    if tag == _TAG_INT_NEG:
+        n = 255 - dados[pos]
+        return -int.from_bytes(dados[pos+1:pos+1+n].translate(_INVERTER), "big"), pos + 1 + n
+    if tag in (_TAG_STR, _TAG_BYTES):
+        bruto = bytearray()
+        while True:
+            fim = dados.index(b"\x00", pos)
+            bruto += dados[pos:fim]
+            pos = fim + 2
+            if dados[fim+1] == 0x00: break
+            bruto.append(0x00)
+        return (bruto.decode("utf-8") if tag == _TAG_STR else bytes(bruto)), pos
+    if tag == _TAG_TUPLA:
+        itens = []
+        while dados[pos] != 0x00:
+            item, pos = _decodificar(dados, pos)
+            itens.append(item)
+        return tuple(itens), pos + 1
+    raise ValueError(f"Chave codificada inválida (tag {tag}).")
+
+def interpretar_chave(texto):
+    """Converte o texto digitado na interface em chave: inteiros (inclusive '042') e literais
+    Python (42, 'abc', ('acme', 7)) são avaliados; qualquer outro texto é usado como string."""
+    texto = texto.strip()
+    try: return int(texto)
+    except ValueError: pass
+    try: return ast.literal_eval(texto)
+    except (ValueError, TypeError, SyntaxError, RecursionError): return texto
+
+MAX_CHAVES_LOTE = 100000
+MAX_NOS_VISUALIZACAO = 400
+
+def _verificar_tamanho_lote(n):
+    if n > MAX_CHAVES_LOTE: raise ValueError(f"Lote grande demais: o máximo é {MAX_CHAVES_LOTE} chaves.")
+
+def interpretar_lote(texto):
+    """Converte o texto do campo de lote em uma lista de chaves. Aceita 'aleatorio N' e
+    'sequencial N' (N inteiros gerados), 'a..b' (intervalo inclusivo), 'range(a, b[, passo])'
+    e listas de literais ('[1, 2, 3]', "5, 'abc', 9", "[('acme', 7), ('acme', 8)]"). Uma tupla
+    entre parênteses, como "('acme', 7)", é uma única chave composta. Qualquer outro texto
+    gera ValueError: ao contrário do campo de chave única, o lote não vira uma string."""
+    texto = texto.strip()
+    gerador = re.fullmatch(r"(aleat[oó]rio|sequencial)\s+(\d+)", texto, re.IGNORECASE)
+    if gerador:
+        n = int(gerador.group(2))
+        _verificar_tamanho_lote(n)
+        if gerador.group(1).lower() == "sequencial": return list(range(1, n + 1))
+        return random.sample(range(10 * n), n)
+    intervalo = re.fullmatch(r"(-?\d+)\s*\.\.\s*(-?\d+)", texto)
+    if intervalo:
+        a, b = int(intervalo.group(1)), int(intervalo.group(2))
+        _verificar_tamanho_lote(b - a + 1)
+        return list(range(a, b + 1))
+    intervalo = re.fullmatch(r"range\(([-\d\s,]+)\)", texto)
+    if intervalo:
+        r = range(*(int(x) for x in intervalo.group(1).split(",")))
+        # len() de um range maior que sys.maxsize levanta OverflowError
+        _verificar_tamanho_lote((r.stop - r.start + r.step - (1 if r.step > 0 else -1)) // r.step)
+        return list(r)
+    try: valor = int(texto)
+    except ValueError:
+        try: valor = ast.literal_eval(texto)
+        except (ValueError, TypeError, SyntaxError, RecursionError):
+            raise ValueError("Lote inválido: use uma lista de literais, a..b, range(a, b), 'aleatorio N' ou 'sequencial N'.")
+    if isinstance(valor, list):
+        _verificar_tamanho_lote(len(valor))
+        return valor
+    if isinstance(valor, tuple) and not _tupla_entre_parenteses(texto):
+        _verificar_tamanho_lote(len(valor))
+        return list(valor)
+    return [valor]
+
+def _tupla_entre_parenteses(texto):
+    # Numa tupla entre parênteses o nó começa no '(' antes do primeiro elemento;
+    # numa sequência solta ("1, 2" ou "(1, 2), (3, 4)") ambos começam na mesma coluna.
+    try: no = ast.parse(texto, mode="eval").body
+    except (SyntaxError, ValueError): return False
+    return isinstance(no, ast.Tuple) and (not no.elts or no.col_offset < no.elts[0].col_offset)
+
 # ===================================================================
 # ESTRUTURA DA ÁRVORE B (t=3) - AGORA COM REMOÇÃO
 # ===================================================================
 
+def _tamanhos_grupos(n, alvo, minimo, separadores=False, minimo_grupos=1):
+    """Tamanhos dos grupos para repartir n itens em nós com cerca de 'alvo' itens cada, sem nenhum
+    abaixo de 'minimo'. Com separadores, um item entre cada par de grupos fica fora dos grupos."""
+    extra = 1 if separadores else 0
+    g = max(minimo_grupos, -(-(n + extra) // (alvo + extra)))
+    while g > minimo_grupos and (n - extra * (g - 1)) // g < minimo: g -= 1
+    base, resto = divmod(n - extra * (g - 1), g)
+    return [base + 1 if i < resto else base for i in range(g)]
+
 class NoB:
     """Classe para um Nó da Árvore B."""
     def __init__(self, t, arvore_b, folha=True):
@@ -23,14 +174,23 @@ class ArvoreB:
         if t < 2: raise ValueError("O grau mínimo 't' da Árvore B deve ser pelo menos 2.")
         self.t = t
         self.log = []
+        self.registrar_log = True # Desligado nas operações em lote
         self.id_counter = 0
         self.raiz = NoB(t, self)
+        # Estatísticas estruturais mantidas a cada divisão/fusão
+        self.altura = 1
+        self.num_nos = 1
+        self.num_folhas = 1
+        self.num_chaves = 0
+        self.num_divisoes = 0
+        self.num_fusoes = 0
 
     def get_next_id(self):
         self.id_counter += 1
         return self.id_counter
 
     def buscar(self, k):
+        k = codificar_chave(k)
         self.log.clear()
         no_atual = self.raiz
         caminho = []
@@ -39,57 +199,71 @@ class ArvoreB:
             while i < len(no_atual.chaves) and k > no_atual.chaves[i]: i += 1
             caminho.append((no_atual, i))
             if i < len(no_atual.chaves) and k == no_atual.chaves[i]:
-                self.log.append(f"Chave {k} encontrada no nó {no_atual.id}.")
+                if self.registrar_log: self.log.append(f"Chave {k} encontrada no nó {no_atual.id}.")
                 return (True, caminho)
             if no_atual.folha:
-                self.log.append(f"Chegou à folha {no_atual.id}, chave {k} não encontrada.")
+                if self.registrar_log: self.log.append(f"Chegou à folha {no_atual.id}, chave {k} não encontrada.")
                 return (False, caminho)
-            self.log.append(f"Nó {no_atual.id}, descendo para o filho {i}.")
+            if self.registrar_log: self.log.append(f"Nó {no_atual.id}, descendo para o filho {i}.")
             no_atual = no_atual.filhos[i]
 
     # --- INSERÇÃO (Sem alterações) ---
     def inserir(self, k):
-        try: k_int = int(k)
-        except (ValueError, TypeError): return False, "❌ Erro: Chave deve ser um número inteiro."
+        try: chave = codificar_chave(k)
+        except (ValueError, TypeError) as e: return False, f"❌ Erro: {e}"
+        if not self._inserir_chave(chave): return False, f"❌ Erro: Chave {chave} já existe na árvore."
+        return True, f"✅ Chave {chave} inserida.\n" + "\n".join(self.log)
+
+    def inserir_lote(self, chaves):
+        """Insere várias chaves sem registrar log. Retorna um bool por chave
+        (chaves de tipo não suportado contam como falha)."""
+        registrar, self.registrar_log = self.registrar_log, False
+        try: return [chave is not None and self._inserir_chave(chave) for chave in map(_codificar_ou_nada, chaves)]
+        finally: self.registrar_log = registrar
+
+    def _inserir_chave(self, chave):
         self.log.clear()
-        encontrado, _ = self.buscar(k_int)
-        if encontrado: return False, f"❌ Erro: Chave {k_int} já existe na árvore."
+        encontrado, _ = self.buscar(chave)
+        if encontrado: return False
         raiz = self.raiz
         if len(raiz.chaves) == (2 * self.t - 1):
-            self.log.append(f"Raiz {raiz.id} está cheia. Dividindo a raiz.")
+            if self.registrar_log: self.log.append(f"Raiz {raiz.id} está cheia. Dividindo a raiz.")
             nova_raiz = NoB(self.t, self, folha=False)
             self.raiz = nova_raiz
+            self.altura += 1; self.num_nos += 1
             nova_raiz.filhos.append(raiz)
             self._dividir_filho(nova_raiz, 0)
-            self._inserir_nao_cheio(nova_raiz, k_int)
+            self._inserir_nao_cheio(nova_raiz, chave)
         else:
-            self._inserir_nao_cheio(raiz, k_int)
-        return True, f"✅ Chave {k_int} inserida.\n" + "\n".join(self.log)
+            self._inserir_nao_cheio(raiz, chave)
+        self.num_chaves += 1
+        return True
 
     def _inserir_nao_cheio(self, no, k):
         i = len(no.chaves) - 1
         if no.folha:
-            self.log.append(f"Inserindo chave {k} no nó folha {no.id}.")
+            if self.registrar_log: self.log.append(f"Inserindo chave {k} no nó folha {no.id}.")
             no.chaves.append(None)
             while i >= 0 and k < no.chaves[i]: no.chaves[i+1] = no.chaves[i]; i -= 1
             no.chaves[i+1] = k
         else:
             while i >= 0 and k < no.chaves[i]: i -= 1
             i += 1
-            self.log.append(f"Descendo para o filho {i} do nó {no.id}.")
+            if self.registrar_log: self.log.append(f"Descendo para o filho {i} do nó {no.id}.")
             if len(no.filhos[i].chaves) == (2 * self.t - 1):
-                self.log.append(f"Filho {no.filhos[i].id} está cheio. Dividindo...")
+                if self.registrar_log: self.log.append(f"Filho {no.filhos[i].id} está cheio. Dividindo...")
                 self._dividir_filho(no, i)
                 if k > no.chaves[i]:
                     i += 1
-                    self.log.append(f"Chave {k} > mediana {no.chaves[i-1]}, descendo para novo filho {i}.")
+                    if self.registrar_log: self.log.append(f"Chave {k} > mediana {no.chaves[i-1]}, descendo para novo filho {i}.")
                 else:
-                    self.log.append(f"Chave {k} <= mediana {no.chaves[i]}, continuando no filho {i}.")
+                    if self.registrar_log: self.log.append(f"Chave {k} <= mediana {no.chaves[i]}, continuando no filho {i}.")
             self._inserir_nao_cheio(no.filhos[i], k)
 
     def _dividir_filho(self, pai, i):
         t = self.t; filho_cheio = pai.filhos[i]
         novo_irmao = NoB(t, self, folha=filho_cheio.folha)
+        self.num_nos += 1; self.num_folhas += filho_cheio.folha; self.num_divisoes += 1
         novo_irmao.chaves = filho_cheio.chaves[t:]
         chave_mediana = filho_cheio.chaves[t-1]
         filho_cheio.chaves = filho_cheio.chaves[:t-1]
@@ -98,28 +272,39 @@ class ArvoreB:
             filho_cheio.filhos = filho_cheio.filhos[:t]
         pai.filhos.insert(i + 1, novo_irmao)
         pai.chaves.insert(i, chave_mediana)
-        self.log.append(f"Divisão: Nó {filho_cheio.id} dividido. Chave {chave_mediana} promovida para {pai.id}. Novo nó {novo_irmao.id} criado.")
+        if self.registrar_log: self.log.append(f"Divisão: Nó {filho_cheio.id} dividido. Chave {chave_mediana} promovida para {pai.id}. Novo nó {novo_irmao.id} criado.")
         
     # --- REMOÇÃO (Nova Implementação para Árvore B) ---
     def remover(self, k):
-        try: k_int = int(k)
-        except (ValueError, TypeError): return False, "❌ Erro: Chave deve ser um número inteiro."
-        
+        try: chave = codificar_chave(k)
+        except (ValueError, TypeError) as e: return False, f"❌ Erro: {e}"
+        if not self._remover_chave(chave): return False, f"❌ Erro: Chave {chave} não encontrada na árvore."
+        return True, f"✅ Chave {chave} removida.\n" + "\n".join(self.log)
+
+    def remover_lote(self, chaves):
+        """Remove várias chaves sem registrar log. Retorna um bool por chave."""
+        registrar, self.registrar_log = self.registrar_log, False
+        try: return [chave is not None and self._remover_chave(chave) for chave in map(_codificar_ou_nada, chaves)]
+        finally: self.registrar_log = registrar
+
+    def _remover_chave(self, chave):
         self.log.clear()
-        encontrado, _ = self.buscar(k_int)
+        encontrado, _ = self.buscar(chave)
         if not encontrado:
-            return False, f"❌ Erro: Chave {k_int} não encontrada na árvore."
+            return False
         
         self.log.clear() # Limpa o log da busca
-        self.log.append(f"Iniciando remoção da chave {k_int}...")
-        self._remover(self.raiz, k_int)
+        if self.registrar_log: self.log.append(f"Iniciando remoção da chave {chave}...")
+        self._remover(self.raiz, chave)
 
         # Se a raiz ficar vazia, seu único filho se torna a nova raiz
         if len(self.raiz.chaves) == 0 and not self.raiz.folha and self.raiz.filhos:
-            self.log.append(f"Raiz {self.raiz.id} ficou vazia. Nova raiz é {self.raiz.filhos[0].id}.")
+            if self.registrar_log: self.log.append(f"Raiz {self.raiz.id} ficou vazia. Nova raiz é {self.raiz.filhos[0].id}.")
             self.raiz = self.raiz.filhos[0]
+            self.altura -= 1; self.num_nos -= 1
             
-        return True, f"✅ Chave {k_int} removida.\n" + "\n".join(self.log)
+        self.num_chaves -= 1
+        return True
 
     def _remover(self, no, k):
         i = 0
@@ -156,7 +341,7 @@ class ArvoreB:
                  
     def _remover_de_folha(self, no, i):
         no.chaves.pop(i)
-        self.log.append(f"Removida chave do nó folha {no.id}.")
+        if self.registrar_log: self.log.append(f"Removida chave do nó folha {no.id}.")
 
     def _remover_de_interno(self, no, i):
         k = no.chaves[i]
@@ -166,25 +351,25 @@ class ArvoreB:
         if len(filho_esq.chaves) >= self.t:
             # Caso A: Filho esquerdo tem chaves suficientes
             pred = self._get_predecessor(filho_esq)
-            self.log.append(f"Substituindo {k} pelo predecessor {pred}.")
+            if self.registrar_log: self.log.append(f"Substituindo {k} pelo predecessor {pred}.")
             no.chaves[i] = pred
             self._remover(filho_esq, pred)
         elif len(filho_dir.chaves) >= self.t:
             # Caso B: Filho direito tem chaves suficientes
             succ = self._get_sucessor(filho_dir)
-            self.log.append(f"Substituindo {k} pelo sucessor {succ}.")
+            if self.registrar_log: self.log.append(f"Substituindo {k} pelo sucessor {succ}.")
             no.chaves[i] = succ
             self._remover(filho_dir, succ)
         else:
             # Caso C: Ambos os filhos têm t-1 chaves. Fundir!
-            self.log.append(f"Filhos de {k} têm apenas {self.t-1} chaves. Fundindo...")
+            if self.registrar_log: self.log.append(f"Filhos de {k} têm apenas {self.t-1} chaves. Fundindo...")
             self._fundir(no, i)
             # 'k' foi movido para o filho esquerdo. Remove 'k' de lá.
             self._remover(filho_esq, k)
 
     def _preencher_filho(self, no_pai, i):
         """Garante que o filho 'i' de 'no_pai' tenha pelo menos 't' chaves."""
-        self.log.append(f"Nó {no_pai.filhos[i].id} tem < {self.t} chaves. Tentando enriquecer...")
+        if self.registrar_log: self.log.append(f"Nó {no_pai.filhos[i].id} tem < {self.t} chaves. Tentando enriquecer...")
         
         if i != 0 and len(no_pai.filhos[i-1].chaves) >= self.t:
             self._emprestar_do_anterior(no_pai, i)
@@ -206,7 +391,7 @@ class ArvoreB:
         if not filho.folha:
             filho.filhos.insert(0, irmao.filhos.pop())
             
-        self.log.append(f"-> Empréstimo (Rotação) do irmão esquerdo {irmao.id} para {filho.id}.")
+        if self.registrar_log: self.log.append(f"-> Empréstimo (Rotação) do irmão esquerdo {irmao.id} para {filho.id}.")
 
     def _emprestar_do_proximo(self, pai, i):
         filho = pai.filhos[i]
@@ -218,7 +403,7 @@ class ArvoreB:
         if not filho.folha:
             filho.filhos.append(irmao.filhos.pop(0))
         
-        self.log.append(f"-> Empréstimo (Rotação) do irmão direito {irmao.id} para {filho.id}.")
+        if self.registrar_log: self.log.append(f"-> Empréstimo (Rotação) do irmão direito {irmao.id} para {filho.id}.")
 
     def _fundir(self, pai, i):
         filho = pai.filhos[i]
@@ -232,8 +417,9 @@ class ArvoreB:
             filho.filhos.extend(irmao.filhos)
             
         pai.filhos.pop(i+1) # Remove o ponteiro para o antigo irmão
+        self.num_nos -= 1; self.num_folhas -= filho.folha; self.num_fusoes += 1
         
-        self.log.append(f"-> Fusão (Merge) do nó {filho.id} com {irmao.id}. Chave {chave_pai} desceu de {pai.id}.")
+        if self.registrar_log: self.log.append(f"-> Fusão (Merge) do nó {filho.id} com {irmao.id}. Chave {chave_pai} desceu de {pai.id}.")
         
     def _get_predecessor(self, no):
         atual = no
@@ -246,6 +432,91 @@ class ArvoreB:
         while not atual.folha:
             atual = atual.filhos[0]
         return atual.chaves[0]
+
+    # --- ESTATÍSTICAS E COMPACTAÇÃO ---
+    def estatisticas(self):
+        """Estatísticas estruturais mantidas incrementalmente (sem percorrer a árvore)."""
+        return {"altura": self.altura, "nos": self.num_nos, "folhas": self.num_folhas, "chaves": self.num_chaves,
+                "ocupacao": self.num_chaves / (self.num_nos * (2 * self.t - 1)),
+                "divisoes": self.num_divisoes, "fusoes": self.num_fusoes}
+
+    def _chaves_por_no(self, ocupacao):
+        if not isinstance(ocupacao, (int, float)) or not 0 < ocupacao <= 1:
+            raise ValueError("A ocupação alvo deve estar entre 0 (exclusivo) e 1.")
+        return max(self.t - 1, min(2 * self.t - 1, round(ocupacao * (2 * self.t - 1))))
+
+    def compactar(self, ocupacao=0.9, limiar=None):
+        """Reconstrói a árvore com nós preenchidos até 'ocupacao'. Com 'limiar', reconstrói só as
+        regiões (nó pai e suas folhas) cuja ocupação está abaixo dele. Nos dois modos os nós novos
+        (e as cópias do caminho até a raiz) são montados à parte e instalados por uma única
+        atribuição a self.raiz; nenhum nó antigo é alterado, então leituras em andamento seguem
+        na versão antiga."""
+        try: alvo = self._chaves_por_no(ocupacao)
+        except ValueError as e: return False, f"❌ Erro: {e}"
+        if limiar is not None and (not isinstance(limiar, (int, float)) or not 0 < limiar <= 1):
+            return False, "❌ Erro: O limiar deve estar entre 0 (exclusivo) e 1."
+        self.log.clear()
+        nos_antes = self.num_nos
+        if limiar is None:
+            self._carregar_ordenadas(self._chaves_em_ordem(self.raiz), alvo)
+            self.log.append(f"Árvore reconstruída com até {alvo} chaves por nó.")
+        else:
+            self.raiz = self._compactar_subarvore(self.raiz, True, alvo, limiar)
+        return True, f"✅ Compactação concluída: {nos_antes} -> {self.num_nos} nós.\n" + "\n".join(self.log)
+
+    def _chaves_em_ordem(self, no):
+        if no.folha: return list(no.chaves)
+        chaves = []
+        for i, filho in enumerate(no.filhos):
+            chaves.extend(self._chaves_em_ordem(filho))
+            if i < len(no.chaves): chaves.append(no.chaves[i])
+        return chaves
+
+    def _compactar_subarvore(self, no, e_raiz, alvo, limiar):
+        """Devolve 'no' se nada mudou abaixo dele; senão, uma cópia apontando para as regiões compactadas."""
+        if no.folha: return no
+        if no.filhos[0].folha: return self._compactar_regiao(no, e_raiz, alvo, limiar)
+        filhos = [self._compactar_subarvore(filho, False, alvo, limiar) for filho in no.filhos]
+        if all(novo is velho for novo, velho in zip(filhos, no.filhos)): return no
+        copia = NoB(self.t, self, folha=False)
+        copia.chaves, copia.filhos = list(no.chaves), filhos
+        return copia
+
+    def _montar_nivel(self, chaves, filhos, alvo, minimo_grupos=1):
+        """Reparte 'chaves' em nós de um nível; a chave entre dois grupos sobe para o nível de cima."""
+        tamanhos = _tamanhos_grupos(len(chaves), alvo, self.t - 1, separadores=True, minimo_grupos=minimo_grupos)
+        nos, separadores, pos, pos_filho = [], [], 0, 0
+        for g, tamanho in enumerate(tamanhos):
+            no = NoB(self.t, self, folha=not filhos)
+            no.chaves = chaves[pos:pos + tamanho]; pos += tamanho
+            if filhos: no.filhos = filhos[pos_filho:pos_filho + tamanho + 1]; pos_filho += tamanho + 1
+            if g < len(tamanhos) - 1: separadores.append(chaves[pos]); pos += 1
+            nos.append(no)
+        return nos, separadores
+
+    def _carregar_ordenadas(self, chaves, alvo):
+        """Monta uma árvore nova a partir de chaves ordenadas e a instala no lugar da atual."""
+        nivel, separadores = self._montar_nivel(chaves, [], alvo)
+        altura, nos, folhas = 1, len(nivel), len(nivel)
+        while len(nivel) > 1:
+            nivel, separadores = self._montar_nivel(separadores, nivel, alvo)
+            altura += 1; nos += len(nivel)
+        self.raiz = nivel[0]
+        self.altura, self.num_nos, self.num_folhas, self.num_chaves = altura, nos, folhas, len(chaves)
+
+    def _compactar_regiao(self, pai, e_raiz, alvo, limiar):
+        """Devolve 'pai' intacto ou um novo pai com as folhas compactadas."""
+        ocupacao = sum(len(f.chaves) for f in pai.filhos) / (len(pai.filhos) * (2 * self.t - 1))
+        if ocupacao >= limiar: return pai
+        chaves = self._chaves_em_ordem(pai)
+        minimo = 2 if e_raiz else self.t
+        if len(_tamanhos_grupos(len(chaves), alvo, self.t - 1, separadores=True, minimo_grupos=minimo)) >= len(pai.filhos): return pai
+        folhas, separadores = self._montar_nivel(chaves, [], alvo, minimo_grupos=minimo)
+        novo_pai = NoB(self.t, self, folha=False)
+        novo_pai.chaves, novo_pai.filhos = separadores, folhas
+        self.num_nos -= len(pai.filhos) - len(folhas); self.num_folhas -= len(pai.filhos) - len(folhas)
+        self.log.append(f"Região do nó {pai.id} ({ocupacao:.0%} ocupada): {len(pai.filhos)} -> {len(folhas)} folhas, novo pai {novo_pai.id}.")
+        return novo_pai
         
 # ===================================================================
 # ESTRUTURA DA ÁRVORE B+ (t=3) - COM REMOÇÃO
@@ -272,71 +543,114 @@ class ArvoreBPlus:
         if t < 2: raise ValueError("O grau mínimo 't' da Árvore B+ deve ser pelo menos 2.")
         self.t = t
         self.log = []
+        self.registrar_log = True # Desligado nas operações em lote
         self.id_counter = 0
         self.raiz = NoBPlus(t, self)
+        # Estatísticas estruturais mantidas a cada divisão/fusão
+        self.altura = 1
+        self.num_nos = 1
+        self.num_folhas = 1
+        self.num_chaves = 0
+        self.num_divisoes = 0
+        self.num_fusoes = 0
 
     def get_next_id(self):
         self.id_counter += 1
         return self.id_counter
 
     def buscar(self, k):
+        k = codificar_chave(k)
         self.log.clear()
         no_atual = self.raiz
         caminho = []
         while not no_atual.folha:
             i = 0
-            while i < len(no_atual.chaves) and k > no_atual.chaves[i]:
+            while i < len(no_atual.chaves) and k >= no_atual.chaves[i]:
                 i += 1
             caminho.append((no_atual, i))
-            self.log.append(f"Nó interno {no_atual.id}, descendo para o filho {i}.")
+            if self.registrar_log: self.log.append(f"Nó interno {no_atual.id}, descendo para o filho {i}.")
             no_atual = no_atual.filhos[i]
         caminho.append((no_atual, 0))
         i = 0
         while i < len(no_atual.chaves) and k > no_atual.chaves[i]:
             i += 1
         if i < len(no_atual.chaves) and k == no_atual.chaves[i]:
-            self.log.append(f"Chave {k} encontrada no nó folha {no_atual.id}.")
+            if self.registrar_log: self.log.append(f"Chave {k} encontrada no nó folha {no_atual.id}.")
             return (True, caminho, no_atual)
         else:
-            self.log.append(f"Chegou à folha {no_atual.id}, chave {k} não encontrada.")
+            if self.registrar_log: self.log.append(f"Chegou à folha {no_atual.id}, chave {k} não encontrada.")
             return (False, caminho, None)
 
+    def buscar_intervalo(self, inicio=None, fim=None):
+        """Retorna as chaves em [inicio, fim] percorrendo a lista encadeada das folhas."""
+        if inicio is not None: inicio = codificar_chave(inicio)
+        if fim is not None: fim = codificar_chave(fim)
+        return [decodificar_chave(chave) for chave in self._varrer_folhas(inicio, fim)]
+
+    def _varrer_folhas(self, inicio=None, fim=None):
+        no_atual = self.raiz
+        while not no_atual.folha:
+            i = 0
+            while inicio is not None and i < len(no_atual.chaves) and inicio >= no_atual.chaves[i]:
+                i += 1
+            no_atual = no_atual.filhos[i]
+        resultado = []
+        while no_atual:
+            for chave in no_atual.chaves:
+                if fim is not None and chave > fim: return resultado
+                if inicio is None or chave >= inicio: resultado.append(chave)
+            no_atual = no_atual.proximo
+        return resultado
+
     def inserir(self, k):
-        try: k_int = int(k)
-        except (ValueError, TypeError): return False, "❌ Erro: Chave deve ser um número inteiro."
+        try: chave = codificar_chave(k)
+        except (ValueError, TypeError) as e: return False, f"❌ Erro: {e}"
+        if not self._inserir_chave(chave): return False, f"❌ Erro: Chave {chave} já existe na árvore."
+        return True, f"✅ Chave {chave} inserida.\n" + "\n".join(self.log)
+
+    def inserir_lote(self, chaves):
+        """Insere várias chaves sem registrar log. Retorna um bool por chave
+        (chaves de tipo não suportado contam como falha)."""
+        registrar, self.registrar_log = self.registrar_log, False
+        try: return [chave is not None and self._inserir_chave(chave) for chave in map(_codificar_ou_nada, chaves)]
+        finally: self.registrar_log = registrar
+
+    def _inserir_chave(self, chave):
         self.log.clear()
-        encontrado, _, _ = self.buscar(k_int)
-        if encontrado: return False, f"❌ Erro: Chave {k_int} já existe na árvore."
+        encontrado, _, _ = self.buscar(chave)
+        if encontrado: return False
         
         self.log.clear()
         raiz = self.raiz
         if len(raiz.chaves) == (2 * self.t - 1):
-            self.log.append(f"Raiz {raiz.id} está cheia. Dividindo a raiz.")
+            if self.registrar_log: self.log.append(f"Raiz {raiz.id} está cheia. Dividindo a raiz.")
             nova_raiz = NoBPlus(self.t, self, folha=False)
             self.raiz = nova_raiz
+            self.altura += 1; self.num_nos += 1
             nova_raiz.filhos.append(raiz)
             raiz.pai = nova_raiz
             self._dividir_filho(nova_raiz, 0)
-            self._inserir_nao_cheio(nova_raiz, k_int)
+            self._inserir_nao_cheio(nova_raiz, chave)
         else:
-            self._inserir_nao_cheio(raiz, k_int)
-        return True, f"✅ Chave {k_int} inserida.\n" + "\n".join(self.log)
+            self._inserir_nao_cheio(raiz, chave)
+        self.num_chaves += 1
+        return True
 
     def _inserir_nao_cheio(self, no, k):
         if no.folha:
             i = 0
             while i < len(no.chaves) and k > no.chaves[i]: i += 1
             no.chaves.insert(i, k)
-            self.log.append(f"Inserindo chave {k} no nó folha {no.id}.")
+            if self.registrar_log: self.log.append(f"Inserindo chave {k} no nó folha {no.id}.")
         else:
             i = 0
-            while i < len(no.chaves) and k > no.chaves[i]: i += 1
-            self.log.append(f"Descendo do nó {no.id} para o filho {i}.")
+            while i < len(no.chaves) and k >= no.chaves[i]: i += 1
+            if self.registrar_log: self.log.append(f"Descendo do nó {no.id} para o filho {i}.")
             filho = no.filhos[i]
             if len(filho.chaves) == (2 * self.t - 1):
-                self.log.append(f"Filho {filho.id} está cheio. Dividindo...")
+                if self.registrar_log: self.log.append(f"Filho {filho.id} está cheio. Dividindo...")
                 self._dividir_filho(no, i)
-                if k > no.chaves[i]:
+                if k >= no.chaves[i]:
                     i += 1
             no.filhos[i].pai = no
             self._inserir_nao_cheio(no.filhos[i], k)
@@ -345,6 +659,7 @@ class ArvoreBPlus:
         t = self.t
         filho_cheio = pai.filhos[i]
         novo_irmao = NoBPlus(t, self, folha=filho_cheio.folha)
+        self.num_nos += 1; self.num_folhas += filho_cheio.folha; self.num_divisoes += 1
         novo_irmao.pai = pai
         
         if filho_cheio.folha:
@@ -356,7 +671,7 @@ class ArvoreBPlus:
             filho_cheio.proximo = novo_irmao
             pai.chaves.insert(i, chave_mediana_copiada)
             pai.filhos.insert(i + 1, novo_irmao)
-            self.log.append(f"Divisão (Folha): Nó {filho_cheio.id} dividido. Chave {chave_mediana_copiada} COPIADA para {pai.id}. Novo nó folha {novo_irmao.id} criado.")
+            if self.registrar_log: self.log.append(f"Divisão (Folha): Nó {filho_cheio.id} dividido. Chave {chave_mediana_copiada} COPIADA para {pai.id}. Novo nó folha {novo_irmao.id} criado.")
         else:
             idx_mediano = t - 1
             chave_mediana_movida = filho_cheio.chaves.pop(idx_mediano)
@@ -367,62 +682,78 @@ class ArvoreBPlus:
             for filho in novo_irmao.filhos: filho.pai = novo_irmao
             pai.chaves.insert(i, chave_mediana_movida)
             pai.filhos.insert(i + 1, novo_irmao)
-            self.log.append(f"Divisão (Interno): Nó {filho_cheio.id} dividido. Chave {chave_mediana_movida} MOVIDA para {pai.id}. Novo nó {novo_irmao.id} criado.")
+            if self.registrar_log: self.log.append(f"Divisão (Interno): Nó {filho_cheio.id} dividido. Chave {chave_mediana_movida} MOVIDA para {pai.id}. Novo nó {novo_irmao.id} criado.")
 
     def remover(self, k):
-        try: k_int = int(k)
-        except (ValueError, TypeError): return False, "❌ Erro: Chave deve ser um número inteiro."
-        
+        try: chave = codificar_chave(k)
+        except (ValueError, TypeError) as e: return False, f"❌ Erro: {e}"
+        if not self._remover_chave(chave): return False, f"❌ Erro: Chave {chave} não encontrada na árvore."
+        return True, f"✅ Chave {chave} removida.\n" + "\n".join(self.log)
+
+    def remover_lote(self, chaves):
+        """Remove várias chaves sem registrar log. Retorna um bool por chave."""
+        registrar, self.registrar_log = self.registrar_log, False
+        try: return [chave is not None and self._remover_chave(chave) for chave in map(_codificar_ou_nada, chaves)]
+        finally: self.registrar_log = registrar
+
+    def _remover_chave(self, chave):
         self.log.clear()
-        encontrado, _, no_folha = self.buscar(k_int)
+        encontrado, _, no_folha = self.buscar(chave)
         
         if not encontrado:
-            return False, f"❌ Erro: Chave {k_int} não encontrada na árvore."
+            return False
         
         self.log.clear()
-        self.log.append(f"Iniciando remoção da chave {k_int}...")
+        if self.registrar_log: self.log.append(f"Iniciando remoção da chave {chave}...")
         
-        self._remover_recursivo(no_folha, k_int)
+        self._remover_recursivo(no_folha, chave)
         
         # Se a raiz ficar vazia, seu único filho se torna a nova raiz
         if len(self.raiz.chaves) == 0 and not self.raiz.folha and self.raiz.filhos:
-            self.log.append(f"Raiz {self.raiz.id} ficou vazia. Nova raiz é {self.raiz.filhos[0].id}.")
+            if self.registrar_log: self.log.append(f"Raiz {self.raiz.id} ficou vazia. Nova raiz é {self.raiz.filhos[0].id}.")
             self.raiz = self.raiz.filhos[0]
             self.raiz.pai = None
+            self.altura -= 1; self.num_nos -= 1
             
-        return True, f"✅ Chave {k_int} removida.\n" + "\n".join(self.log)
+        self.num_chaves -= 1
+        return True
 
     def _remover_recursivo(self, no, k):
         # 1. Remove a chave (só acontece na folha na primeira chamada)
         if k in no.chaves:
             no.chaves.remove(k)
-            self.log.append(f"Chave {k} removida do nó {no.id}.")
+            if self.registrar_log: self.log.append(f"Chave {k} removida do nó {no.id}.")
         
         # 2. Verifica Underflow
         if no.esta_em_underflow():
-            self.log.append(f"Nó {no.id} está em underflow. Balanceando...")
-            pai = no.pai
-            i = pai.filhos.index(no)
-            
-            # Tenta emprestar do irmão esquerdo
-            if i > 0 and len(pai.filhos[i-1].chaves) > (self.t - 1):
-                self._emprestar(no, pai.filhos[i-1], pai, i-1, 'esq')
-            # Tenta emprestar do irmão direito
-            elif i < len(pai.filhos) - 1 and len(pai.filhos[i+1].chaves) > (self.t - 1):
-                self._emprestar(no, pai.filhos[i+1], pai, i, 'dir')
-            # Precisa fundir
-            else:
-                if i > 0:
-                    self._fundir(pai.filhos[i-1], no, pai, i-1)
-                else:
-                    self._fundir(no, pai.filhos[i+1], pai, i)
+            self._balancear(no)
         
         # 3. Atualiza Chave do Pai
         # Esta é a parte crucial: Se a menor chave de um nó muda,
         # a chave-guia no pai deve ser atualizada.
-        if no.pai:
+        # (Se 'no' foi fundido ao irmão esquerdo, ele já não pertence ao pai.)
+        if no.pai and no in no.pai.filhos:
             self._atualizar_chaves_pais(no)
 
+    def _balancear(self, no):
+        """Corrige o underflow de 'no' (folha ou interno) por empréstimo ou fusão."""
+        if self.registrar_log: self.log.append(f"Nó {no.id} está em underflow. Balanceando...")
+        pai = no.pai
+        i = pai.filhos.index(no)
+        
+        # Tenta emprestar do irmão esquerdo
+        if i > 0 and len(pai.filhos[i-1].chaves) > (self.t - 1):
+            self._emprestar(no, pai.filhos[i-1], pai, i-1, 'esq')
+        # Tenta emprestar do irmão direito
+        elif i < len(pai.filhos) - 1 and len(pai.filhos[i+1].chaves) > (self.t - 1):
+            self._emprestar(no, pai.filhos[i+1], pai, i, 'dir')
+        # Precisa fundir
+        else:
+            if i > 0:
+                self._fundir(pai.filhos[i-1], no, pai, i-1)
+            else:
+                self._fundir(no, pai.filhos[i+1], pai, i)
+
     def _emprestar(self, no_vazio, irmao, pai, idx_chave_pai, direcao):
         if direcao == 'esq':
             if no_vazio.folha:
@@ -437,7 +768,7 @@ class ArvoreBPlus:
                 irmao_chave = irmao.chaves.pop()
                 no_vazio.chaves.insert(0, pai_chave)
                 pai.chaves[idx_chave_pai] = irmao_chave
-            self.log.append(f"-> Empréstimo (Rotação) do irmão esquerdo {irmao.id} para {no_vazio.id}.")
+            if self.registrar_log: self.log.append(f"-> Empréstimo (Rotação) do irmão esquerdo {irmao.id} para {no_vazio.id}.")
                 
         elif direcao == 'dir':
             if no_vazio.folha:
@@ -452,10 +783,11 @@ class ArvoreBPlus:
                 irmao_chave = irmao.chaves.pop(0)
                 no_vazio.chaves.append(pai_chave)
                 pai.chaves[idx_chave_pai] = irmao_chave
-            self.log.append(f"-> Empréstimo (Rotação) do irmão direito {irmao.id} para {no_vazio.id}.")
+            if self.registrar_log: self.log.append(f"-> Empréstimo (Rotação) do irmão direito {irmao.id} para {no_vazio.id}.")
 
     def _fundir(self, no_esq, no_dir, pai, idx_chave_pai):
-        self.log.append(f"-> Fusão (Merge) do nó {no_dir.id} no nó {no_esq.id}.")
+        if self.registrar_log: self.log.append(f"-> Fusão (Merge) do nó {no_dir.id} no nó {no_esq.id}.")
+        self.num_nos -= 1; self.num_folhas -= no_esq.folha; self.num_fusoes += 1
         
         if no_esq.folha:
             no_esq.chaves.extend(no_dir.chaves)
@@ -490,7 +822,7 @@ class ArvoreBPlus:
             if nova_chave_guia is not None and pai.chaves[i-1] != nova_chave_guia:
                  # Checa se a chave antiga (a guia) ainda está na árvore
                  if pai.chaves[i-1] in no.chaves:
-                    self.log.append(f"Atualizando guia no pai {pai.id}: {pai.chaves[i-1]} -> {nova_chave_guia}")
+                    if self.registrar_log: self.log.append(f"Atualizando guia no pai {pai.id}: {pai.chaves[i-1]} -> {nova_chave_guia}")
                     pai.chaves[i-1] = nova_chave_guia
                     self._atualizar_chaves_pais(pai) # Propaga a mudança para cima
         
@@ -498,6 +830,312 @@ class ArvoreBPlus:
         if pai.pai:
             self._atualizar_chaves_pais(pai)
 
+    # --- ESTATÍSTICAS E COMPACTAÇÃO ---
+    def estatisticas(self):
+        """Estatísticas estruturais mantidas incrementalmente (sem percorrer a árvore).
+        A ocupação considera só as folhas, onde ficam os dados."""
+        return {"altura": self.altura, "nos": self.num_nos, "folhas": self.num_folhas, "chaves": self.num_chaves,
+                "comprimento_cadeia_folhas": self.num_folhas,
+                "ocupacao": self.num_chaves / (self.num_folhas * (2 * self.t - 1)),
+                "divisoes": self.num_divisoes, "fusoes": self.num_fusoes}
+
+    def _chaves_por_no(self, ocupacao):
+        if not isinstance(ocupacao, (int, float)) or not 0 < ocupacao <= 1:
+            raise ValueError("A ocupação alvo deve estar entre 0 (exclusivo) e 1.")
+        return max(self.t - 1, min(2 * self.t - 1, round(ocupacao * (2 * self.t - 1))))
+
+    def compactar(self, ocupacao=0.9, limiar=None):
+        """Reconstrói a árvore com nós preenchidos até 'ocupacao'. Com 'limiar', reconstrói só as
+        regiões (nó pai e suas folhas) cuja ocupação está abaixo dele.
+
+        A reconstrução completa monta a árvore à parte e a instala com uma única atribuição a
+        self.raiz, sem alterar nós antigos, então leituras em andamento seguem na versão antiga.
+        A compactação por regiões, não: ela religa no lugar a lista encadeada e o nó avô (copiar
+        a folha anterior exigiria copiar toda a lista à esquerda). Uma varredura por intervalo em
+        andamento pode passar para as folhas novas; as chaves vistas são as mesmas."""
+        try: alvo = self._chaves_por_no(ocupacao)
+        except ValueError as e: return False, f"❌ Erro: {e}"
+        if limiar is not None and (not isinstance(limiar, (int, float)) or not 0 < limiar <= 1):
+            return False, "❌ Erro: O limiar deve estar entre 0 (exclusivo) e 1."
+        self.log.clear()
+        nos_antes = self.num_nos
+        if limiar is None:
+            self._carregar_ordenadas(self._varrer_folhas(), alvo)
+            self.log.append(f"Árvore reconstruída com até {alvo} chaves por nó.")
+        else:
+            anterior = None
+            for pai in self._pais_de_folhas(self.raiz):
+                anterior = self._compactar_regiao(pai, anterior, alvo, limiar)
+        return True, f"✅ Compactação concluída: {nos_antes} -> {self.num_nos} nós.\n" + "\n".join(self.log)
+
+    def _pais_de_folhas(self, no):
+        """Nós internos cujos filhos são folhas, da esquerda para a direita."""
+        if no.folha: return []
+        if no.filhos[0].folha: return [no]
+        return [pai for filho in no.filhos for pai in self._pais_de_folhas(filho)]
+
+    def _montar_folhas(self, chaves, alvo, minimo_grupos=1):
+        folhas, pos = [], 0
+        for tamanho in _tamanhos_grupos(len(chaves), alvo, self.t - 1, minimo_grupos=minimo_grupos):
+            folha = NoBPlus(self.t, self)
+            folha.chaves = chaves[pos:pos + tamanho]; pos += tamanho
+            if folhas: folhas[-1].proximo = folha
+            folhas.append(folha)
+        return folhas
+
+    def _carregar_ordenadas(self, chaves, alvo):
+        """Monta uma árvore nova a partir de chaves ordenadas e a instala no lugar da atual."""
+        nivel = self._montar_folhas(chaves, alvo)
+        menor = {no.id: no.chaves[0] for no in nivel if no.chaves}
+        altura, nos, folhas = 1, len(nivel), len(nivel)
+        while len(nivel) > 1:
+            acima, pos = [], 0
+            for tamanho in _tamanhos_grupos(len(nivel), alvo + 1, self.t):
+                no = NoBPlus(self.t, self, folha=False)
+                no.filhos = nivel[pos:pos + tamanho]; pos += tamanho
+                no.chaves = [menor[filho.id] for filho in no.filhos[1:]]
+                for filho in no.filhos: filho.pai = no
+                menor[no.id] = menor[no.filhos[0].id]
+                acima.append(no)
+            nivel = acima
+            altura += 1; nos += len(nivel)
+        self.raiz = nivel[0]
+        self.altura, self.num_nos, self.num_folhas, self.num_chaves = altura, nos, folhas, len(chaves)
+
+    def _compactar_regiao(self, pai, anterior, alvo, limiar):
+        """Compacta as folhas de 'pai' se estiverem abaixo do limiar. 'anterior' é a folha que
+        precede a região; retorna a última folha da região (nova ou antiga)."""
+        ocupacao = sum(len(f.chaves) for f in pai.filhos) / (len(pai.filhos) * (2 * self.t - 1))
+        chaves = [chave for f in pai.filhos for chave in f.chaves]
+        minimo = 2 if pai.pai is None else self.t
+        if ocupacao >= limiar or len(_tamanhos_grupos(len(chaves), alvo, self.t - 1, minimo_grupos=minimo)) >= len(pai.filhos):
+            return pai.filhos[-1]
+        folhas = self._montar_folhas(chaves, alvo, minimo_grupos=minimo)
+        folhas[-1].proximo = pai.filhos[-1].proximo
+        novo_pai = NoBPlus(self.t, self, folha=False)
+        novo_pai.chaves = [f.chaves[0] for f in folhas[1:]]
+        novo_pai.filhos, novo_pai.pai = folhas, pai.pai
+        for f in folhas: f.pai = novo_pai
+        # Primeiro a lista encadeada, depois o pai: até a troca, buscas pontuais seguem nas folhas antigas.
+        if anterior: anterior.proximo = folhas[0]
+        if pai.pai is None: self.raiz = novo_pai
+        else: pai.pai.filhos[pai.pai.filhos.index(pai)] = novo_pai
+        self.num_nos -= len(pai.filhos) - len(folhas); self.num_folhas -= len(pai.filhos) - len(folhas)
+        self.log.append(f"Região do nó {pai.id} ({ocupacao:.0%} ocupada): {len(pai.filhos)} -> {len(folhas)} folhas, novo pai {novo_pai.id}.")
+        return folhas[-1]
+
+
+# ===================================================================
+# ÁRVORE B+ PARTICIONADA (SHARDS POR INTERVALO EM PROCESSOS)
+# ===================================================================
+
+def _reconstruir_bplus(t, chaves_ordenadas):
+    arvore = ArvoreBPlus(t)
+    arvore.registrar_log = False # Ninguém lê o log dentro do processo do shard
+    arvore._carregar_ordenadas(chaves_ordenadas, arvore._chaves_por_no(0.9))
+    return arvore
+
+def _processo_shard(conexao, t, chaves):
+    """Laço do processo de um shard: mantém uma ArvoreBPlus e responde aos comandos do roteador."""
+    arvore = _reconstruir_bplus(t, chaves)
+    while True:
+        op, args = conexao.recv()
+        if op == "encerrar":
+            conexao.close()
+            return
+        if op == "inserir": resposta = arvore.inserir_lote(args)
+        elif op == "remover": resposta = arvore.remover_lote(args)
+        elif op == "buscar": resposta = [arvore.buscar(k)[0] for k in args]
+        elif op == "intervalo": resposta = arvore.buscar_intervalo(*args)
+        elif op == "extrair":
+            # Retira as n maiores (ou menores) chaves e reconstrói a árvore com o restante.
+            # Devolve também a menor chave da metade superior, que vira a nova fronteira.
+            n, do_fim = args
+            todas = arvore._varrer_folhas()
+            corte = len(todas) - n if do_fim else n
+            inferiores, superiores = todas[:corte], todas[corte:]
+            movidas, restantes = (superiores, inferiores) if do_fim else (inferiores, superiores)
+            arvore = _reconstruir_bplus(t, restantes)
+            resposta = (movidas, superiores[0])
+        conexao.send(resposta)
+
+class ArvoreBPlusParticionada:
+    """Árvore B+ com o espaço de chaves dividido em intervalos, cada um em um processo próprio.
+
+    O shard j guarda as chaves em [limites[j-1], limites[j]). Operações pontuais vão ao
+    shard dono; lotes e intervalos são enviados a todos os shards envolvidos antes de
+    coletar as respostas, que são remontadas em ordem.
+    """
+    def __init__(self, t=3, limites=None, max_shards=None, capacidade_shard=50000, fator_desbalanceamento=1.5):
+        if t < 2: raise ValueError("O grau mínimo 't' da Árvore B+ deve ser pelo menos 2.")
+        if capacidade_shard < 1: raise ValueError("A capacidade de um shard deve ser pelo menos 1.")
+        self.t = t
+        self.limites = sorted(codificar_chave(k) for k in limites) if limites else []
+        self.max_shards = max(max_shards or os.cpu_count() or 1, len(self.limites) + 1)
+        self.capacidade_shard = capacidade_shard
+        self.fator_desbalanceamento = fator_desbalanceamento
+        self.log = []
+        self.shards = [self._iniciar_shard([]) for _ in range(len(self.limites) + 1)]
+        self.tamanhos = [0] * len(self.shards)
+
+    def _iniciar_shard(self, chaves):
+        conexao, conexao_filho = multiprocessing.Pipe()
+        processo = multiprocessing.Process(target=_processo_shard, args=(conexao_filho, self.t, chaves), daemon=True)
+        processo.start()
+        conexao_filho.close()
+        return processo, conexao
+
+    def encerrar(self):
+        for processo, conexao in self.shards:
+            conexao.send(("encerrar", None)); conexao.close()
+            processo.join()
+        self.shards = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.encerrar()
+
+    def __len__(self):
+        return sum(self.tamanhos)
+
+    def _indice_shard(self, k):
+        return bisect.bisect_right(self.limites, k)
+
+    def _distribuir(self, op, chaves):
+        """Agrupa as chaves por shard, envia todos os pedidos e só então coleta as respostas."""
+        grupos = {}
+        for pos, k in enumerate(chaves):
+            if k is not None: grupos.setdefault(self._indice_shard(k), []).append(pos)
+        for j, posicoes in grupos.items():
+            self.shards[j][1].send((op, [chaves[p] for p in posicoes]))
+        resultado = [False] * len(chaves)
+        sucessos = {}
+        for j, posicoes in grupos.items():
+            respostas = self.shards[j][1].recv()
+            for p, r in zip(posicoes, respostas): resultado[p] = r
+            sucessos[j] = sum(respostas)
+        return resultado, sucessos
+
+    # --- OPERAÇÕES EM LOTE ---
+    def inserir_lote(self, chaves):
+        self.log.clear()
+        resultado, sucessos = self._distribuir("inserir", [_codificar_ou_nada(k) for k in chaves])
+        for j, n in sucessos.items(): self.tamanhos[j] += n
+        self._rebalancear()
+        return resultado
+
+    def remover_lote(self, chaves):
+        self.log.clear()
+        resultado, sucessos = self._distribuir("remover", [_codificar_ou_nada(k) for k in chaves])
+        for j, n in sucessos.items(): self.tamanhos[j] -= n
+        self._rebalancear()
+        return resultado
+
+    def buscar_lote(self, chaves):
+        return self._distribuir("buscar", [_codificar_ou_nada(k) for k in chaves])[0]
+
+    def buscar_intervalo(self, inicio=None, fim=None):
+        if inicio is not None: inicio = codificar_chave(inicio)
+        if fim is not None: fim = codificar_chave(fim)
+        primeiro = 0 if inicio is None else self._indice_shard(inicio)
+        ultimo = len(self.shards) - 1 if fim is None else self._indice_shard(fim)
+        for j in range(primeiro, ultimo + 1):
+            self.shards[j][1].send(("intervalo", (inicio, fim)))
+        resultado = []
+        for j in range(primeiro, ultimo + 1):
+            resultado.extend(self.shards[j][1].recv())
+        return resultado
+
+    # --- OPERAÇÕES PONTUAIS ---
+    def inserir(self, k):
+        try: chave = codificar_chave(k)
+        except (ValueError, TypeError) as e: return False, f"❌ Erro: {e}"
+        if not self.inserir_lote([chave])[0]: return False, f"❌ Erro: Chave {chave} já existe na árvore."
+        return True, f"✅ Chave {chave} inserida.\n" + "\n".join(self.log)
+
+    def remover(self, k):
+        try: chave = codificar_chave(k)
+        except (ValueError, TypeError) as e: return False, f"❌ Erro: {e}"
+        if not self.remover_lote([chave])[0]: return False, f"❌ Erro: Chave {chave} não encontrada na árvore."
+        return True, f"✅ Chave {chave} removida.\n" + "\n".join(self.log)
+
+    def buscar(self, k):
+        return self.buscar_lote([k])[0]
+
+    # --- DIVISÃO E MIGRAÇÃO DE SHARDS ---
+    def _rebalancear(self):
+        """Divide shards acima da capacidade e migra chaves de shards muito maiores que a média."""
+        while True:
+            j = max(range(len(self.tamanhos)), key=self.tamanhos.__getitem__)
+            maior = self.tamanhos[j]
+            if maior > self.capacidade_shard and len(self.shards) < self.max_shards:
+                self._dividir_shard(j)
+                continue
+            if len(self.shards) == 1: return
+            if maior <= self.fator_desbalanceamento * len(self) / len(self.shards): return
+            # Migra entre o par de vizinhos mais desigual: o vizinho do maior shard
+            # pode ser tão cheio quanto ele, e a carga precisa andar pela cadeia.
+            pares = [(i, i + 1) for i in range(len(self.shards) - 1)] + [(i + 1, i) for i in range(len(self.shards) - 1)]
+            origem, destino = max(pares, key=lambda par: self.tamanhos[par[0]] - self.tamanhos[par[1]])
+            n = (self.tamanhos[origem] - self.tamanhos[destino]) // 2
+            # Migrações menores que um nó cheio não compensam a reconstrução dos shards.
+            if n < 2 * self.t - 1: return
+            self._migrar(origem, destino, n)
+
+    def _dividir_shard(self, j):
+        self.shards[j][1].send(("extrair", (self.tamanhos[j] // 2, True)))
+        movidas, fronteira = self.shards[j][1].recv()
+        self.limites.insert(j, fronteira)
+        self.shards.insert(j + 1, self._iniciar_shard(movidas))
+        self.tamanhos[j] -= len(movidas)
+        self.tamanhos.insert(j + 1, len(movidas))
+        self.log.append(f"Divisão de shard: shard {j} dividido na chave {fronteira}. {len(movidas)} chaves movidas para o novo shard {j + 1}.")
+
+    def _migrar(self, origem, destino, n):
+        do_fim = destino > origem
+        self.shards[origem][1].send(("extrair", (n, do_fim)))
+        movidas, fronteira = self.shards[origem][1].recv()
+        self.shards[destino][1].send(("inserir", movidas))
+        self.shards[destino][1].recv()
+        self.limites[min(origem, destino)] = fronteira
+        self.tamanhos[origem] -= len(movidas)
+        self.tamanhos[destino] += len(movidas)
+        self.log.append(f"Migração: {len(movidas)} chaves do shard {origem} para o shard {destino}. Nova fronteira {fronteira}.")
+
+def benchmark_escalabilidade(n_chaves=100000, max_nucleos=None, t=3):
+    """Mede a vazão de inserção e busca em lote da árvore particionada com 1 a N processos."""
+    max_nucleos = max_nucleos or os.cpu_count() or 1
+    universo = 10 * n_chaves
+    chaves = random.Random(42).sample(range(universo), n_chaves)
+    print(f"{'shards':>6} | {'inserção (chaves/s)':>20} | {'busca (chaves/s)':>18} | {'speedup':>7}")
+    base = None
+    for n in range(1, max_nucleos + 1):
+        limites = [universo * i // n for i in range(1, n)]
+        with ArvoreBPlusParticionada(t=t, limites=limites, max_shards=n, capacidade_shard=n_chaves) as arvore:
+            inicio = time.perf_counter(); arvore.inserir_lote(chaves); tempo_inserir = time.perf_counter() - inicio
+            inicio = time.perf_counter(); arvore.buscar_lote(chaves); tempo_buscar = time.perf_counter() - inicio
+        vazao_inserir = n_chaves / tempo_inserir
+        base = base or vazao_inserir
+        print(f"{n:>6} | {vazao_inserir:>20.0f} | {n_chaves / tempo_buscar:>18.0f} | {vazao_inserir / base:>6.2f}x")
+
+
+def benchmark_chaves_compostas(n_chaves=200000):
+    """Compara o custo de ordenar e buscar tuplas nativas com o das mesmas chaves codificadas."""
+    gerador = random.Random(42)
+    tuplas = [(f"cliente-{gerador.randrange(100)}", gerador.randrange(10**12)) for _ in range(n_chaves)]
+    inicio = time.perf_counter(); codificadas = [codificar_chave(k) for k in tuplas]; tempo_codificar = time.perf_counter() - inicio
+    print(f"Codificação de {n_chaves} chaves: {tempo_codificar:.3f}s (feita uma vez, na entrada da API)")
+    print(f"{'chaves':>8} | {'ordenação (s)':>13} | {'bisect (s)':>10}")
+    for nome, chaves in (("tuplas", tuplas), ("bytes", codificadas)):
+        inicio = time.perf_counter(); ordenadas = sorted(chaves); tempo_ordenar = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        for k in chaves: bisect.bisect_left(ordenadas, k)
+        tempo_bisect = time.perf_counter() - inicio
+        print(f"{nome:>8} | {tempo_ordenar:>13.3f} | {tempo_bisect:>10.3f}")
+    print(f"Mesma ordem: {sorted(tuplas) == [decodificar_chave(k) for k in sorted(codificadas)]}")
+
 
 # ===================================================================
 # FUNÇÕES DE VISUALIZAÇÃO (NetworkX + Matplotlib)
@@ -559,6 +1197,7 @@ def renderizar_com_matplotlib(G, labels, node_colors, edge_labels=None, leaf_edg
 
 def formatar_b_para_exibicao(arvore, caminho_destacado=None):
     if not arvore.raiz or (not arvore.raiz.chaves and arvore.raiz.folha): return None
+    if arvore.num_nos > MAX_NOS_VISUALIZACAO: return None
     G = nx.DiGraph(); labels = {}; node_colors = {}
     highlight_nodes = {no.id for no, _ in caminho_destacado} if caminho_destacado else set()
     
@@ -579,6 +1218,7 @@ def formatar_b_para_exibicao(arvore, caminho_destacado=None):
 
 def formatar_bplus_para_exibicao(arvore, caminho_destacado=None):
     if not arvore.raiz or (not arvore.raiz.chaves and arvore.raiz.folha): return None
+    if arvore.num_nos > MAX_NOS_VISUALIZACAO: return None
     G = nx.DiGraph(); labels = {}; node_colors = {}
     leaf_nodes = [] 
     highlight_nodes = {no.id for no, _ in caminho_destacado} if caminho_destacado else set()
@@ -626,17 +1266,17 @@ def formatar_bplus_para_exibicao(arvore, caminho_destacado=None):
 
 def inserir_b(arv, val):
     if not val: return arv, gr.update(), "❌ Erro: Forneça um valor."
-    sucesso, msg = arv.inserir(val); imagem = formatar_b_para_exibicao(arv)
+    sucesso, msg = arv.inserir(interpretar_chave(val)); imagem = formatar_b_para_exibicao(arv)
     return arv, gr.update(value=imagem), msg
 def remover_b(arv, val):
     if not val: return arv, gr.update(), "❌ Erro: Forneça um valor."
-    sucesso, msg = arv.remover(val); imagem = formatar_b_para_exibicao(arv)
+    sucesso, msg = arv.remover(interpretar_chave(val)); imagem = formatar_b_para_exibicao(arv)
     return arv, gr.update(value=imagem), msg
 def buscar_b(arv, val):
     if not val: return gr.update(), "Forneça um valor para buscar."
-    try: k_int = int(val)
-    except (ValueError, TypeError): return gr.update(), "❌ Erro: Chave deve ser um número inteiro."
-    encontrado, caminho = arv.buscar(k_int)
+    try: chave = codificar_chave(interpretar_chave(val))
+    except (ValueError, TypeError) as e: return gr.update(), f"❌ Erro: {e}"
+    encontrado, caminho = arv.buscar(chave)
     caminho_formatado = []
     for no, idx_filho in caminho:
         chaves_str = ",".join(map(str, no.chaves)) if no.chaves else "[]"
@@ -648,19 +1288,19 @@ def buscar_b(arv, val):
 
 def inserir_bplus(arv, val):
     if not val: return arv, gr.update(), "❌ Erro: Forneça um valor."
-    sucesso, msg = arv.inserir(val)
+    sucesso, msg = arv.inserir(interpretar_chave(val))
     imagem = formatar_bplus_para_exibicao(arv)
     return arv, gr.update(value=imagem), msg
 def remover_bplus(arv, val):
     if not val: return arv, gr.update(), "❌ Erro: Forneça um valor."
-    sucesso, msg = arv.remover(val)
+    sucesso, msg = arv.remover(interpretar_chave(val))
     imagem = formatar_bplus_para_exibicao(arv)
     return arv, gr.update(value=imagem), msg
 def buscar_bplus(arv, val):
     if not val: return gr.update(), "Forneça um valor para buscar."
-    try: k_int = int(val)
-    except (ValueError, TypeError): return gr.update(), "❌ Erro: Chave deve ser um número inteiro."
-    encontrado, caminho, _ = arv.buscar(k_int)
+    try: chave = codificar_chave(interpretar_chave(val))
+    except (ValueError, TypeError) as e: return gr.update(), f"❌ Erro: {e}"
+    encontrado, caminho, _ = arv.buscar(chave)
     caminho_formatado = []
     for no, idx_filho in caminho:
         chaves_str = ",".join(map(str, no.chaves)) if no.chaves else "[]"
@@ -673,54 +1313,102 @@ def buscar_bplus(arv, val):
     imagem = formatar_bplus_para_exibicao(arv, caminho)
     return gr.update(value=imagem), msg
 
+def _aplicar_lote(arv, texto, operacao, formatar):
+    """Aplica o lote inteiro pela API da árvore e renderiza uma única vez no final."""
+    if not texto: return arv, gr.update(), "❌ Erro: Forneça um lote."
+    try: chaves = interpretar_lote(texto)
+    except (ValueError, TypeError) as e: return arv, gr.update(), f"❌ Erro: {e}"
+    antes = arv.estatisticas()
+    inicio = time.perf_counter()
+    resultados = operacao(chaves)
+    tempo = time.perf_counter() - inicio
+    depois = arv.estatisticas()
+    imagem = formatar(arv)
+    msg = (f"✅ {sum(resultados)} de {len(chaves)} chaves aplicadas em {tempo * 1000:.1f} ms "
+           f"({len(chaves) - sum(resultados)} ignoradas).\n"
+           f"Divisões: {depois['divisoes'] - antes['divisoes']} | Fusões: {depois['fusoes'] - antes['fusoes']}\n"
+           f"Altura: {depois['altura']} | Nós: {depois['nos']} | Folhas: {depois['folhas']} | "
+           f"Chaves: {depois['chaves']} | Ocupação: {depois['ocupacao']:.0%}")
+    if depois['nos'] > MAX_NOS_VISUALIZACAO:
+        msg += f"\nVisualização omitida: a árvore tem mais de {MAX_NOS_VISUALIZACAO} nós."
+    return arv, gr.update(value=imagem), msg
+
+def inserir_lote_b(arv, texto): return _aplicar_lote(arv, texto, arv.inserir_lote, formatar_b_para_exibicao)
+def remover_lote_b(arv, texto): return _aplicar_lote(arv, texto, arv.remover_lote, formatar_b_para_exibicao)
+def inserir_lote_bplus(arv, texto): return _aplicar_lote(arv, texto, arv.inserir_lote, formatar_bplus_para_exibicao)
+def remover_lote_bplus(arv, texto): return _aplicar_lote(arv, texto, arv.remover_lote, formatar_bplus_para_exibicao)
+
 # ===================================================================
 # CONSTRUÇÃO DA INTERFACE (GRADIO)
 # ===================================================================
-with gr.Blocks(theme=gr.themes.Soft(), css="footer {display: none !important}") as demo:
+def construir_interface():
+    """Monta a interface Gradio. Fica numa função para que importar o módulo
+    (como fazem os processos dos shards) não construa a interface."""
+    with gr.Blocks(theme=gr.themes.Soft(), css="footer {display: none !important}") as demo:
     
-    estado_b = gr.State(lambda: ArvoreB(t=3)) 
-    estado_bplus = gr.State(lambda: ArvoreBPlus(t=3))
-
-    gr.Markdown("# 🌳 Interface para Árvores B e B+")
-    gr.Markdown("Selecione a aba correspondente à árvore que deseja manipular.")
-
-    with gr.Row():
-        with gr.Column(scale=1):
-            with gr.Tabs():
-                with gr.TabItem("Árvore B"):
-                    gr.Markdown("Árvore com grau mínimo **t=3**.\n- Mínimo de chaves: t-1 = **2**\n- Máximo de chaves: 2t-1 = **5**")
-                    gr.Markdown("### Inserir / Remover / Buscar"); input_b_valor = gr.Textbox(label="Valor da Chave (inteiro)")
-                    with gr.Row():
-                        btn_b_inserir = gr.Button("Inserir", variant="primary")
-                        btn_b_remover = gr.Button("Remover", variant="stop")
-                    btn_b_buscar = gr.Button("Buscar")
-                    gr.Markdown("*(Remoção da B-Tree implementada!)*") # ATUALIZADO
+        estado_b = gr.State(lambda: ArvoreB(t=3)) 
+        estado_bplus = gr.State(lambda: ArvoreBPlus(t=3))
+
+        gr.Markdown("# 🌳 Interface para Árvores B e B+")
+        gr.Markdown("Selecione a aba correspondente à árvore que deseja manipular.")
+
+        with gr.Row():
+            with gr.Column(scale=1):
+                with gr.Tabs():
+                    with gr.TabItem("Árvore B"):
+                        gr.Markdown("Árvore com grau mínimo **t=3**.\n- Mínimo de chaves: t-1 = **2**\n- Máximo de chaves: 2t-1 = **5**")
+                        gr.Markdown("### Inserir / Remover / Buscar"); input_b_valor = gr.Textbox(label="Valor da Chave (inteiro, texto ou tupla)")
+                        with gr.Row():
+                            btn_b_inserir = gr.Button("Inserir", variant="primary")
+                            btn_b_remover = gr.Button("Remover", variant="stop")
+                        btn_b_buscar = gr.Button("Buscar")
+                        gr.Markdown("### Operações em Lote"); input_b_lote = gr.Textbox(label="Lote (lista, a..b, range(a, b), 'aleatorio N' ou 'sequencial N')")
+                        with gr.Row():
+                            btn_b_inserir_lote = gr.Button("Inserir lote", variant="primary")
+                            btn_b_remover_lote = gr.Button("Remover lote", variant="stop")
+                        gr.Markdown("*(Remoção da B-Tree implementada!)*") # ATUALIZADO
                 
-                with gr.TabItem("Árvore B+"):
-                    gr.Markdown("Árvore com grau mínimo **t=3**.\n- Mínimo de chaves: t-1 = **2**\n- Máximo de chaves: 2t-1 = **5**")
-                    gr.Markdown("Nós internos são guias (azuis). Dados reais estão nas folhas (verdes).")
-                    gr.Markdown("### Inserir / Remover / Buscar"); input_bplus_valor = gr.Textbox(label="Valor da Chave (inteiro)")
-                    with gr.Row():
-                        btn_bplus_inserir = gr.Button("Inserir", variant="primary")
-                        btn_bplus_remover = gr.Button("Remover", variant="stop")
-                    btn_bplus_buscar = gr.Button("Buscar")
-                    gr.Markdown("*(Remoção da B+ implementada!)*")
-
-            gr.Markdown("### Status da Ação")
-            output_status = gr.Textbox(label="Resultado", interactive=False, lines=10)
-
-        with gr.Column(scale=2):
-            gr.Markdown("### Visualização da Árvore")
-            output_visualizacao = gr.Image(label="Estrutura Atual", height=600, interactive=False)
-
-    # Conexões da Árvore B
-    btn_b_inserir.click(fn=inserir_b, inputs=[estado_b, input_b_valor], outputs=[estado_b, output_visualizacao, output_status])
-    btn_b_remover.click(fn=remover_b, inputs=[estado_b, input_b_valor], outputs=[estado_b, output_visualizacao, output_status])
-    btn_b_buscar.click(fn=buscar_b, inputs=[estado_b, input_b_valor], outputs=[output_visualizacao, output_status])
+                    with gr.TabItem("Árvore B+"):
+                        gr.Markdown("Árvore com grau mínimo **t=3**.\n- Mínimo de chaves: t-1 = **2**\n- Máximo de chaves: 2t-1 = **5**")
+                        gr.Markdown("Nós internos são guias (azuis). Dados reais estão nas folhas (verdes).")
+                        gr.Markdown("### Inserir / Remover / Buscar"); input_bplus_valor = gr.Textbox(label="Valor da Chave (inteiro, texto ou tupla)")
+                        with gr.Row():
+                            btn_bplus_inserir = gr.Button("Inserir", variant="primary")
+                            btn_bplus_remover = gr.Button("Remover", variant="stop")
+                        btn_bplus_buscar = gr.Button("Buscar")
+                        gr.Markdown("### Operações em Lote"); input_bplus_lote = gr.Textbox(label="Lote (lista, a..b, range(a, b), 'aleatorio N' ou 'sequencial N')")
+                        with gr.Row():
+                            btn_bplus_inserir_lote = gr.Button("Inserir lote", variant="primary")
+                            btn_bplus_remover_lote = gr.Button("Remover lote", variant="stop")
+                        gr.Markdown("*(Remoção da B+ implementada!)*")
+
+                gr.Markdown("### Status da Ação")
+                output_status = gr.Textbox(label="Resultado", interactive=False, lines=10)
+
+            with gr.Column(scale=2):
+                gr.Markdown("### Visualização da Árvore")
+                output_visualizacao = gr.Image(label="Estrutura Atual", height=600, interactive=False)
+
+        # Conexões da Árvore B
+        btn_b_inserir.click(fn=inserir_b, inputs=[estado_b, input_b_valor], outputs=[estado_b, output_visualizacao, output_status])
+        btn_b_remover.click(fn=remover_b, inputs=[estado_b, input_b_valor], outputs=[estado_b, output_visualizacao, output_status])
+        btn_b_buscar.click(fn=buscar_b, inputs=[estado_b, input_b_valor], outputs=[output_visualizacao, output_status])
+        btn_b_inserir_lote.click(fn=inserir_lote_b, inputs=[estado_b, input_b_lote], outputs=[estado_b, output_visualizacao, output_status])
+        btn_b_remover_lote.click(fn=remover_lote_b, inputs=[estado_b, input_b_lote], outputs=[estado_b, output_visualizacao, output_status])
     
-    # Conexões da Árvore B+
-    btn_bplus_inserir.click(fn=inserir_bplus, inputs=[estado_bplus, input_bplus_valor], outputs=[estado_bplus, output_visualizacao, output_status])
-    btn_bplus_remover.click(fn=remover_bplus, inputs=[estado_bplus, input_bplus_valor], outputs=[estado_bplus, output_visualizacao, output_status])
-    btn_bplus_buscar.click(fn=buscar_bplus, inputs=[estado_bplus, input_bplus_valor], outputs=[output_visualizacao, output_status])
+        # Conexões da Árvore B+
+        btn_bplus_inserir.click(fn=inserir_bplus, inputs=[estado_bplus, input_bplus_valor], outputs=[estado_bplus, output_visualizacao, output_status])
+        btn_bplus_remover.click(fn=remover_bplus, inputs=[estado_bplus, input_bplus_valor], outputs=[estado_bplus, output_visualizacao, output_status])
+        btn_bplus_buscar.click(fn=buscar_bplus, inputs=[estado_bplus, input_bplus_valor], outputs=[output_visualizacao, output_status])
+        btn_bplus_inserir_lote.click(fn=inserir_lote_bplus, inputs=[estado_bplus, input_bplus_lote], outputs=[estado_bplus, output_visualizacao, output_status])
+        btn_bplus_remover_lote.click(fn=remover_lote_bplus, inputs=[estado_bplus, input_bplus_lote], outputs=[estado_bplus, output_visualizacao, output_status])
+
+    return demo
 
-demo.launch()
\ No newline at end of file
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_escalabilidade()
+    elif "--benchmark-chaves" in sys.argv:
+        benchmark_chaves_compostas()
+    else:
+        construir_interface().launch()